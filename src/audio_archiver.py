@@ -0,0 +1,242 @@
+import soundfile
+import json
+import os
+import queue
+import time
+from threading import Thread
+from typing import Dict, List, Optional
+
+
+class AudioArchiver:
+    def __init__(
+        self,
+        output_dir: str,
+        sample_rate: int = 16000,
+        audio_format: str = "flac",
+        chunk_duration: int = 30,
+        max_queue_size: int = 2000,
+    ):
+        self.formats = {
+            "flac": ("FLAC", "PCM_16", "flac"),
+            "opus": ("OGG", "OPUS", "ogg"),
+        }
+        if audio_format not in self.formats:
+            raise ValueError(f"Unsupported archive format: {audio_format}")
+        container, subtype, _ = self.formats[audio_format]
+        if not soundfile.check_format(container, subtype):
+            raise ValueError(f"libsndfile cannot write {container}/{subtype}")
+
+        self.sample_rate = sample_rate
+        self.audio_format = audio_format
+        self.chunk_duration = chunk_duration
+        self.chunk_samples = int(chunk_duration * sample_rate)
+        self.session_name = time.strftime("session_%Y%m%d_%H%M%S")
+        self.output_dir = os.path.join(output_dir, self.session_name)
+        self.index_path = os.path.join(self.output_dir, "index.jsonl")
+        self.read_only = False
+
+        # Bounded so a slow encoder drops audio instead of stalling capture
+        self.frames_queue = queue.Queue(maxsize=max_queue_size)
+        # Segments are rare and must not be lost to an audio backlog
+        self.segments_queue = queue.Queue()
+        self.is_archiving = False
+        self.dropped_frames = 0
+
+        self.samples_received = 0  # session position of the live stream
+        self.samples_written = 0  # session position of the encoder
+        self.last_segment_end = 0
+        self.segments: List[Dict] = []
+
+        self.current_file = None
+        self.current_chunk = -1
+
+    @classmethod
+    def open_session(cls, session_dir: str) -> "AudioArchiver":
+        # Opens a finished session for replay; the first index record is the header
+        index_path = os.path.join(session_dir, "index.jsonl")
+        with open(index_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        if not records or records[0].get("type") != "header":
+            raise ValueError(f"Missing session header in {index_path}")
+
+        header = records[0]
+        archiver = cls(
+            os.path.dirname(os.path.normpath(session_dir)),
+            sample_rate=header["sample_rate"],
+            audio_format=header["format"],
+            chunk_duration=header["chunk_duration"],
+        )
+        archiver.session_name = os.path.basename(os.path.normpath(session_dir))
+        archiver.output_dir = session_dir
+        archiver.index_path = index_path
+        archiver.read_only = True
+        archiver.segments = [r for r in records[1:] if r.get("type") == "segment"]
+        return archiver
+
+    def start_archiving(self):
+        if self.read_only:
+            raise RuntimeError("Cannot archive into a session opened for replay")
+        os.makedirs(self.output_dir, exist_ok=True)
+        header = {
+            "type": "header",
+            "sample_rate": self.sample_rate,
+            "chunk_duration": self.chunk_duration,
+            "format": self.audio_format,
+        }
+        with open(self.index_path, "w", encoding="utf-8") as index_file:
+            index_file.write(json.dumps(header) + "\n")
+
+        self.is_archiving = True
+        self.archive_thread = Thread(target=self._run_archiving, daemon=True)
+        self.archive_thread.start()
+
+    def stop_archiving(self):
+        self.is_archiving = False
+        if hasattr(self, "archive_thread"):
+            self.archive_thread.join()
+        if self.dropped_frames:
+            print(f"Audio archive dropped {self.dropped_frames} frames")
+
+    def add_audio(self, audio_data: bytes) -> None:
+        if not self.is_archiving:
+            return
+        offset = self.samples_received
+        self.samples_received += len(audio_data) // 2  # 16-bit mono
+        try:
+            self.frames_queue.put_nowait((offset, audio_data))
+        except queue.Full:
+            # The gap is padded with silence so the index stays aligned
+            self.dropped_frames += 1
+
+    def mark_segment(self, transcript: str, end_time: Optional[float] = None) -> None:
+        # end_time is the session time at which the words ended, as reported
+        # by the recognizer; falls back to the current stream position
+        if not self.is_archiving:
+            return
+        if end_time is None:
+            end_sample = self.samples_received
+        else:
+            end_sample = min(int(end_time * self.sample_rate), self.samples_received)
+        end_sample = max(end_sample, self.last_segment_end)
+
+        segment = {
+            "type": "segment",
+            "start": self.last_segment_end / self.sample_rate,
+            "end": end_sample / self.sample_rate,
+            "text": transcript,
+        }
+        self.last_segment_end = end_sample
+        self.segments.append(segment)
+        self.segments_queue.put(segment)
+
+    def _run_archiving(self):
+        with open(self.index_path, "a", encoding="utf-8") as index_file:
+            while (
+                self.is_archiving
+                or not self.frames_queue.empty()
+                or not self.segments_queue.empty()
+            ):
+                while not self.segments_queue.empty():
+                    segment = self.segments_queue.get()
+                    index_file.write(json.dumps(segment, ensure_ascii=False) + "\n")
+                    index_file.flush()
+
+                try:
+                    offset, audio_data = self.frames_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                try:
+                    self._write_audio(offset, audio_data)
+                except Exception as e:
+                    # Write failures (disk full, permissions) don't recover
+                    # frame by frame, so give up once instead of every frame
+                    print(f"Audio archiving stopped: {e}")
+                    self.is_archiving = False
+                    self._close_chunk()
+                    return
+
+        try:
+            # Pad frames dropped at the end of the session
+            self._write_audio(self.samples_received, b"")
+        except Exception as e:
+            print(f"Error in audio archiving: {e}")
+        self._close_chunk()
+
+    def _write_audio(self, offset: int, audio_data: bytes) -> None:
+        if offset > self.samples_written:
+            self._write_samples(b"\x00\x00" * (offset - self.samples_written))
+        self._write_samples(audio_data)
+
+    def _write_samples(self, audio_data: bytes) -> None:
+        # Split writes at chunk boundaries so every chunk holds exactly
+        # chunk_samples samples and positions map directly to files
+        while audio_data:
+            chunk, chunk_offset = divmod(self.samples_written, self.chunk_samples)
+            if chunk != self.current_chunk:
+                self._open_chunk(chunk)
+
+            count = min(len(audio_data) // 2, self.chunk_samples - chunk_offset)
+            self.current_file.buffer_write(audio_data[: count * 2], dtype="int16")
+            self.samples_written += count
+            audio_data = audio_data[count * 2 :]
+
+    def _open_chunk(self, chunk: int) -> None:
+        self._close_chunk()
+        container, subtype, _ = self.formats[self.audio_format]
+        self.current_file = soundfile.SoundFile(
+            self.get_chunk_path(chunk),
+            mode="w",
+            samplerate=self.sample_rate,
+            channels=1,
+            format=container,
+            subtype=subtype,
+        )
+        self.current_chunk = chunk
+
+    def _close_chunk(self) -> None:
+        if self.current_file is not None:
+            self.current_file.close()
+            self.current_file = None
+
+    def get_chunk_path(self, chunk: int) -> str:
+        extension = self.formats[self.audio_format][2]
+        return os.path.join(self.output_dir, f"chunk_{chunk:05d}.{extension}")
+
+    def read_audio(self, start: float, end: float) -> bytes:
+        # Only closed chunks are read: the encoder buffers data and finalizes
+        # headers on close, so audio in the chunk still being written (up to
+        # chunk_duration) can't be replayed until it rotates or the session ends
+        audio_data = b""
+        position = int(start * self.sample_rate)
+        end_position = int(end * self.sample_rate)
+
+        while position < end_position:
+            chunk, chunk_offset = divmod(position, self.chunk_samples)
+            if self.is_archiving and chunk >= self.current_chunk:
+                break
+            path = self.get_chunk_path(chunk)
+            if not os.path.exists(path):
+                break
+
+            with soundfile.SoundFile(path) as f:
+                count = min(end_position - position, f.frames - chunk_offset)
+                if count <= 0:
+                    break
+                f.seek(chunk_offset)
+                data = bytes(f.buffer_read(count, dtype="int16"))
+            if not data:
+                break
+            audio_data += data
+            position += len(data) // 2
+
+        return audio_data
+
+    def read_segment(self, segment: Dict) -> bytes:
+        return self.read_audio(segment["start"], segment["end"])
+
+    def find_segment(self, text: str) -> Optional[Dict]:
+        for segment in reversed(self.segments):
+            if text in segment["text"]:
+                return segment
+        return None
@@ -1,5 +1,6 @@
 import os
 from audio_handler import AudioHandler
+from audio_archiver import AudioArchiver
 from speech_recognizer import SpeechRecognizer
 from subtitle_display import SubtitleDisplay
 import threading
@@ -20,8 +21,22 @@ class SubtitleApp:
         self.last_audio_time = time.time()
         self.silence_threshold = 2  # seconds
 
+        # Optional session audio archive, enabled by setting ARCHIVE_AUDIO_DIR
+        archive_dir = os.environ.get("ARCHIVE_AUDIO_DIR")
+        self.audio_archiver = (
+            AudioArchiver(
+                archive_dir,
+                sample_rate=self.audio_handler.sample_rate,
+                audio_format=os.environ.get("ARCHIVE_AUDIO_FORMAT", "flac"),
+            )
+            if archive_dir
+            else None
+        )
+
     def start(self):
         self.is_running = True
+        if self.audio_archiver:
+            self.audio_archiver.start_archiving()
         self.audio_handler.start_recording()
         self.speech_recognizer.start_recognition()
 
@@ -36,6 +51,8 @@ class SubtitleApp:
         self.is_running = False
         self.audio_handler.stop_recording()
         self.speech_recognizer.stop_recognition()
+        if self.audio_archiver:
+            self.audio_archiver.stop_archiving()
 
     def _process_audio(self):
         while self.is_running:
@@ -43,12 +60,16 @@ class SubtitleApp:
             if audio_data:
                 self.last_audio_time = time.time()
                 self.speech_recognizer.process_audio(audio_data)
+                if self.audio_archiver:
+                    self.audio_archiver.add_audio(audio_data)
             time.sleep(0.001)
 
     def _process_transcription(self):
         while self.is_running:
-            transcript, is_final = self.speech_recognizer.get_transcript()
+            transcript, is_final, end_time = self.speech_recognizer.get_transcript()
             if transcript:
+                if is_final and self.audio_archiver:
+                    self.audio_archiver.mark_segment(transcript, end_time)
                 self.subtitle_display.update_subtitle(transcript, is_final)
             time.sleep(0.001)
 
@@ -19,15 +19,17 @@ class SpeechRecognizer:
             "uk": "uk-UA",
         }
         self.language_code = self.language_codes.get(language_code, language_code)
+        self.sample_rate = 16000
         self.update_config()
         self.responses_queue = queue.Queue()
         self.audio_queue = queue.Queue()
         self.is_running = False
+        self.samples_sent = 0  # session position of audio sent to the API
 
     def update_config(self):
         self.config = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
+            sample_rate_hertz=self.sample_rate,
             language_code=self.language_code,
             enable_automatic_punctuation=True,
             use_enhanced=True,
@@ -61,8 +63,12 @@ class SpeechRecognizer:
                 while self.is_running:
                     if not self.audio_queue.empty():
                         data = self.audio_queue.get()
+                        self.samples_sent += len(data) // 2  # 16-bit mono
                         yield speech.StreamingRecognizeRequest(audio_content=data)
 
+            # result_end_time is relative to the start of each stream
+            stream_start = self.samples_sent / self.sample_rate
+
             try:
                 requests = audio_generator()
                 responses = self.client.streaming_recognize(
@@ -79,8 +85,9 @@ class SpeechRecognizer:
 
                     transcript = result.alternatives[0].transcript
                     is_final = result.is_final
+                    end_time = stream_start + result.result_end_time.total_seconds()
 
-                    self.responses_queue.put((transcript, is_final))
+                    self.responses_queue.put((transcript, is_final, end_time))
 
             except Exception as e:
                 print(f"Error in recognition: {e}")
@@ -89,4 +96,4 @@ class SpeechRecognizer:
     def get_transcript(self):
         if not self.responses_queue.empty():
             return self.responses_queue.get()
-        return None, False
+        return None, False, None
@@ -223,28 +223,38 @@ class SubtitleDisplay:
                 self.interim_format,
             )
 
-        # Update translation displays
-        for section in self.text_displays:
-            if section["language"] == "transcription":
-                continue
+        translation_sections = [
+            section
+            for section in self.text_displays
+            if section["language"] != "transcription"
+        ]
 
+        # Translate all sections concurrently across the channel pool
+        requests = []
+        for section in translation_sections:
             target_lang = section["language"]
+            if self.full_final_text:
+                requests.append((self.full_final_text, source_lang, target_lang, True))
+            if self.current_interim_text:
+                requests.append(
+                    (self.current_interim_text, source_lang, target_lang, False)
+                )
+        results = iter(self.translator.translate_concurrently(requests))
+
+        # Update translation displays
+        for section in translation_sections:
             display = section["display"]
             display.clear()
             cursor = display.textCursor()
 
-            # Translate final text
+            # Insert final text
             if self.full_final_text:
-                translated_final = self.translator.translate(
-                    self.full_final_text, source_lang, target_lang, True
-                )
+                translated_final = next(results)
                 cursor.insertText(translated_final, self.final_format)
 
-            # Translate interim text
+            # Insert interim text
             if self.current_interim_text:
-                translated_interim = self.translator.translate(
-                    self.current_interim_text, source_lang, target_lang, False
-                )
+                translated_interim = next(results)
                 cursor.movePosition(QTextCursor.MoveOperation.End)
                 if translated_interim:
                     cursor.insertText(
@@ -275,6 +285,7 @@ class SubtitleDisplay:
     def start(self):
         self.window.show()
         self.app.exec()
+        self.translator.close()
 
     def stop(self):
         self.app.quit()
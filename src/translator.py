@@ -1,14 +1,182 @@
 from google.cloud import translate
+from google.cloud.translate_v3.services.translation_service.transports import (
+    TranslationServiceGrpcTransport,
+)
+from google.api_core import exceptions as api_exceptions
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import grpc
 import json
 import os
-from typing import Dict, Optional, Tuple
-from threading import Lock
+from typing import Dict, List, Optional, Tuple
+from threading import Event, Lock, Thread
 import time
 
 
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.time()
+        self.lock = Lock()
+
+    def acquire(self) -> None:
+        # Tokens may go negative: each caller reserves its slot in the
+        # schedule and sleeps until it comes due
+        with self.lock:
+            now = time.time()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ChannelPool:
+    def __init__(
+        self,
+        size: int = 3,
+        keepalive_time: int = 300,
+        connect_timeout: float = 5.0,
+        health_check_interval: float = 10.0,
+    ):
+        self.size = size
+        self.connect_timeout = connect_timeout
+        self.health_check_interval = health_check_interval
+        # No pings without active calls: Google's frontends answer idle pings
+        # with GOAWAY too_many_pings. The health thread reconnects idle channels.
+        self.channel_options = [
+            ("grpc.keepalive_time_ms", keepalive_time * 1000),
+            ("grpc.keepalive_timeout_ms", 10000),
+        ]
+        self.lock = Lock()
+        self.is_running = True
+        self.stop_event = Event()
+
+        # Open and connect every channel up front so the first caption
+        # doesn't pay for the TLS handshake. Channels that fail to connect
+        # are skipped by acquire() and reconnected or replaced by the health
+        # thread.
+        self.slots = [self._create_slot() for _ in range(size)]
+        self._warm(self.slots)
+
+        self.health_thread = Thread(target=self._run_health_checks, daemon=True)
+        self.health_thread.start()
+
+    def _create_slot(self) -> dict:
+        channel = TranslationServiceGrpcTransport.create_channel(
+            options=self.channel_options
+        )
+        client = translate.TranslationServiceClient(
+            transport=TranslationServiceGrpcTransport(channel=channel)
+        )
+        slot = {
+            "channel": channel,
+            "client": client,
+            "in_flight": 0,
+            "state": grpc.ChannelConnectivity.IDLE,
+            "suspect": False,
+            "retired": False,
+        }
+        channel.subscribe(lambda state: slot.update(state=state))
+        return slot
+
+    def _warm(self, slots: List[dict]) -> List[dict]:
+        # Start every handshake before waiting so they run in parallel
+        futures = [grpc.channel_ready_future(slot["channel"]) for slot in slots]
+        deadline = time.time() + self.connect_timeout
+        failed = []
+        for slot, future in zip(slots, futures):
+            try:
+                future.result(timeout=max(deadline - time.time(), 0))
+            except (grpc.FutureTimeoutError, ValueError):
+                # ValueError: the channel was closed while connecting
+                future.cancel()
+                failed.append(slot)
+        if failed:
+            print(f"{len(failed)} translation channel(s) failed to connect")
+        return failed
+
+    def is_usable(self, slot: dict) -> bool:
+        return slot["state"] == grpc.ChannelConnectivity.READY and not slot["suspect"]
+
+    def mark_suspect(self, slot: dict) -> None:
+        # Skipped by acquire() until the health thread reconnects or replaces it
+        slot["suspect"] = True
+
+    @contextmanager
+    def acquire(self, exclude: Optional[dict] = None):
+        # Least-loaded connected slot first, so concurrent requests spread
+        # across channels; fall back to any slot if none are connected
+        with self.lock:
+            others = [s for s in self.slots if s is not exclude]
+            if not others:
+                raise RuntimeError("No other translation channel available")
+            candidates = [s for s in others if self.is_usable(s)] or others
+            slot = min(candidates, key=lambda s: s["in_flight"])
+            slot["in_flight"] += 1
+
+        try:
+            yield slot
+        finally:
+            with self.lock:
+                slot["in_flight"] -= 1
+                close = slot["retired"] and slot["in_flight"] == 0
+            if close:
+                slot["channel"].close()
+
+    def replace(self, slot: dict) -> None:
+        new_slot = self._create_slot()
+        if self._warm([new_slot]):
+            # Keep the old slot; the next health check tries again
+            new_slot["channel"].close()
+            return
+        with self.lock:
+            if not self.is_running or slot not in self.slots:
+                new_slot["channel"].close()
+                return
+            self.slots[self.slots.index(slot)] = new_slot
+            slot["retired"] = True
+            close = slot["in_flight"] == 0
+        if close:
+            slot["channel"].close()
+
+    def _run_health_checks(self):
+        while not self.stop_event.wait(self.health_check_interval):
+            for slot in list(self.slots):
+                if not self.is_running:
+                    break
+                if self.is_usable(slot):
+                    continue
+                # Give the channel one more chance to connect before swapping it
+                if not self._warm([slot]):
+                    slot["suspect"] = False
+                    continue
+                print("Translation channel unhealthy, replacing")
+                try:
+                    self.replace(slot)
+                except Exception as e:
+                    print(f"Error replacing translation channel: {e}")
+
+    def close(self) -> None:
+        with self.lock:
+            self.is_running = False
+        self.stop_event.set()
+        self.health_thread.join()
+        with self.lock:
+            for slot in self.slots:
+                slot["retired"] = True
+                if slot["in_flight"] == 0:
+                    slot["channel"].close()
+
+
 class Translator:
-    def __init__(self):
-        self.client = translate.TranslationServiceClient()
+    def __init__(self, pool_size: int = 3):
         credentials_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
         with open(credentials_path) as f:
             project_id = json.load(f)["project_id"]
@@ -27,8 +195,12 @@ class Translator:
             "uk": "Ukrainian",
         }
 
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms between requests to avoid rate limiting
+        # Project-wide quota guard: 10 requests/s on average, with bursts of
+        # up to pool_size so target languages can be sent together
+        self.min_request_interval = 0.1
+        self.rate_limiter = TokenBucket(1 / self.min_request_interval, pool_size)
+        self.channel_pool = ChannelPool(size=pool_size)
+        self.executor = ThreadPoolExecutor(max_workers=pool_size)
 
         self.retries = 3
         self.retry_delay = 1.0
@@ -73,35 +245,42 @@ class Translator:
         if len(self.translation_cache) > self.max_cache_size:
             self.clean_cache()
 
-    def rate_limit(self) -> None:
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last_request)
-        self.last_request_time = time.time()
-
     def is_valid_language(self, lang_code: str) -> bool:
         return lang_code in self.supported_languages
 
     def get_language_name(self, lang_code: str) -> str:
         return self.supported_languages.get(lang_code, lang_code)
 
+    def send_request(self, contents: list, source_lang: str, target_lang: str):
+        request = {
+            "parent": self.parent,
+            "contents": contents,
+            "mime_type": "text/plain",
+            "source_language_code": source_lang,
+            "target_language_code": target_lang,
+        }
+
+        self.rate_limiter.acquire()
+        with self.channel_pool.acquire() as slot:
+            try:
+                return slot["client"].translate_text(request=request)
+            except api_exceptions.ServiceUnavailable:
+                # Leave reconnecting or replacing the channel to the health
+                # thread so this caption isn't held up by a handshake
+                self.channel_pool.mark_suspect(slot)
+                failed_slot = slot
+
+        # Retry once straight away on a different channel
+        self.rate_limiter.acquire()
+        with self.channel_pool.acquire(exclude=failed_slot) as slot:
+            return slot["client"].translate_text(request=request)
+
     def translate_with_retries(
         self, text: str, source_lang: str, target_lang: str
     ) -> Optional[str]:
         for attempt in range(self.retries):
             try:
-                self.rate_limit()
-
-                response = self.client.translate_text(
-                    request={
-                        "parent": self.parent,
-                        "contents": [text],
-                        "mime_type": "text/plain",
-                        "source_language_code": source_lang,
-                        "target_language_code": target_lang,
-                    }
-                )
+                response = self.send_request([text], source_lang, target_lang)
 
                 if response.translations:
                     return response.translations[0].translated_text
@@ -157,6 +336,12 @@ class Translator:
 
         return translated_text
 
+    def translate_concurrently(
+        self, requests: List[Tuple[str, str, str, bool]]
+    ) -> List[str]:
+        # Each request is (text, source_lang, target_lang, is_final)
+        return list(self.executor.map(lambda r: self.translate(*r), requests))
+
     def batch_translate(self, texts: list, source_lang: str, target_lang: str) -> list:
         if not texts:
             return []
@@ -172,17 +357,7 @@ class Translator:
             batch = texts[i : i + self.batch_size]
 
             try:
-                self.rate_limit()
-
-                response = self.client.translate_text(
-                    request={
-                        "parent": self.parent,
-                        "contents": batch,
-                        "mime_type": "text/plain",
-                        "source_language_code": source_lang,
-                        "target_language_code": target_lang,
-                    }
-                )
+                response = self.send_request(batch, source_lang, target_lang)
 
                 translated_texts.extend(
                     [t.translated_text for t in response.translations]
@@ -206,3 +381,7 @@ class Translator:
         if max_size is not None:
             self.max_cache_size = max_size
         self.clean_cache()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
+        self.channel_pool.close()